@@ -1,9 +1,12 @@
 #!/usr/bin/python3
 import os
-import copy
+import functools
+import hashlib
 import itertools
 from pprint import pprint
 import json
+import queue
+import threading
 import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk
@@ -18,10 +21,20 @@ HOST, PORT = "127.0.0.1", 31234
 MIN_VOL = -99.5
 VOL_STEP = 0.5
 VOL_FORMAT = '{:5.1f}'
+# ms between volume/mute reads, to pick up changes made by other DSP clients
+VOL_POLL_INTERVAL = 1000
 
 CONFIG_DIR = os.path.expanduser('~/my-camilladsp-config')
+CACHE_DIR = os.path.expanduser('~/.cache/camilla-remote-control')
+CONFIG_CACHE = os.path.join(CACHE_DIR, 'configs.json')
 
-MENU_MAP = {'config': ('2.1 DRC', '2.1', '2.0', 'Mono'), 
+# (menu label, routing, correction) for each user-selectable config
+CONFIG_ENTRIES = (('2.1 DRC', '2.1', 'DRC'),
+                  ('2.1', '2.1', ''),
+                  ('2.0', '2.0', ''),
+                  ('Mono', 'Mono', ''))
+
+MENU_MAP = {'config': tuple(label for label, _, _ in CONFIG_ENTRIES),
             'source': ('Stream', 'Phono')}            
             
 PLAYBACK_DEVICE = 'hw:CARD=M4,DEV=0'
@@ -71,6 +84,12 @@ KEYBINDINGS = {
    Gdk.KEY_Print: None, # Record button
 }
 
+# Actions that are sent repeatedly while a key is held; autorepeat events
+# for these arriving closer together than KEY_REPEAT_INTERVAL ms are dropped.
+REPEATABLE_ACTIONS = {'vol_up', 'vol_down',
+                      'nav_up', 'nav_down', 'nav_left', 'nav_right'}
+KEY_REPEAT_INTERVAL = 30
+
 
 CSS = b"""
 * {
@@ -92,6 +111,36 @@ label#dB {
 }
 """
 
+# parsed once at import; windows only need to install it
+CSS_PROVIDER = Gtk.CssProvider()
+CSS_PROVIDER.load_from_data(CSS)
+
+# Invariant part of the 'devices' section; create_config() fills in the
+# capture/playback devices, channel counts and sample rate.
+DEVICES_TEMPLATE = {
+    'adjust_period': 10.0,
+    'capture': {'avoid_blocking_read': False,
+                'channels': None,
+                'device': None,
+                'format': 'S32LE',
+                'retry_on_error': False,
+                'type': 'Alsa'},
+    'capture_samplerate': 0,
+    'chunksize': 8192,
+    'enable_rate_adjust': True,
+    'enable_resampling': False,
+    'playback': {'channels': None,
+                 'device': None,
+                 'format': 'S32LE',
+                 'type': 'Alsa'},
+    'queuelimit': 4,
+    'resampler_type': 'BalancedAsync',
+    'samplerate': None,
+    'silence_threshold': 0.0,
+    'silence_timeout': 0.0,
+    'target_level': 0
+}
+
 
 def get_channel_map(destinations, input_channels, mono=False, gain=0.0):
     if mono:
@@ -117,6 +166,7 @@ def get_channel_map(destinations, input_channels, mono=False, gain=0.0):
     return mapping
 
 
+@functools.lru_cache(maxsize=32)
 def create_config(routing='2.1',
                   input_source='Stream',
                   correction='DRC',
@@ -126,6 +176,11 @@ def create_config(routing='2.1',
                   crossover=80,
                   delay=0.0,
                   drc_filter=None):
+    """Build a Camilla config and return it serialized as a JSON string.
+
+    The result is memoized, so it is returned as an immutable string;
+    callers wanting a dict should json.loads() it.
+    """
     input_channels = [0, 1]
     destinations = [0, 1]
     if input_source != 'Stream':
@@ -136,29 +191,14 @@ def create_config(routing='2.1',
         capture_device = 'hw:Loopback,1'
         capture_channels = 2
     config = {}
-    config['devices'] = {
-                            'adjust_period': 10.0,
-                            'capture': {'avoid_blocking_read': False,
-                                        'channels': capture_channels,
-                                        'device': capture_device,
-                                        'format': 'S32LE',
-                                        'retry_on_error': False,
-                                        'type': 'Alsa'},
-                            'capture_samplerate': 0,
-                            'chunksize': 8192,
-                            'enable_rate_adjust': True,
-                            'enable_resampling': False,
-                            'playback': {'channels': playback_channels,
-                                         'device': playback_device,
-                                         'format': 'S32LE',
-                                         'type': 'Alsa'},
-                            'queuelimit': 4,
-                            'resampler_type': 'BalancedAsync',
-                            'samplerate': samplerate,
-                            'silence_threshold': 0.0,
-                            'silence_timeout': 0.0,
-                            'target_level': 0
-                        }
+    # plain JSON data, so a JSON round trip is a cheaper deep copy
+    devices = json.loads(json.dumps(DEVICES_TEMPLATE))
+    devices['capture']['channels'] = capture_channels
+    devices['capture']['device'] = capture_device
+    devices['playback']['channels'] = playback_channels
+    devices['playback']['device'] = playback_device
+    devices['samplerate'] = samplerate
+    config['devices'] = devices
 
     if routing == 'Mono':  # each destination gets both input channels mixed
         mapping = get_channel_map(destinations, input_channels, mono=True,
@@ -230,36 +270,195 @@ def create_config(routing='2.1',
                               for i in sub_destinations]
         pipeline.extend(mains_output_filters)
         pipeline.extend(sub_output_filters)
-    return config
+    return json.dumps(config)
+
+
+@functools.lru_cache(maxsize=256)
+def format_volume(vol):
+    # volumes are VOL_STEP multiples, so there are only ~200 distinct labels
+    return VOL_FORMAT.format(vol)
+
+
+def step_balance(gain0, gain1, side='left'):
+    """Move the balance one VOL_STEP towards `side`.
+
+    Returns the new (gain0, gain1) pair.  Only one channel is ever
+    attenuated; the other is held at 0 dB.
+    """
+    if side == 'left':
+        if gain0 == 0.0:
+            return 0.0, gain1 - VOL_STEP
+        return gain0 + VOL_STEP, 0.0
+    elif side == 'right':
+        if gain1 == 0.0:
+            return gain0 - VOL_STEP, 0.0
+        return 0.0, gain1 + VOL_STEP
+    return gain0, gain1
+
+
+def load_config_cache(path):
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+        # a well-formed file that isn't a list of [digest, obj] pairs
+        # (e.g. from an older layout) raises here and counts as a miss
+        return {digest: validated for digest, validated in entries}
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_config_cache(path, configs):
+    entries = [[digest, validated] for digest, validated in configs.items()]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(entries, f)
+    os.replace(tmp_path, path)
+
+
+class ConfigMap:
+    """User-selectable Camilla config objects, keyed by (config, source).
+
+    Each config is built and validated the first time it is looked up.
+    Validated configs are cached on disk, keyed by a hash of the config
+    generated by create_config, so later runs skip validation until
+    anything that goes into the config changes.
+    """
+
+    def __init__(self, cdsp):
+        self.cdsp = cdsp
+        self.cache_path = CONFIG_CACHE
+        self.configs = load_config_cache(self.cache_path) or {}
+        self.entries = {label: (routing, correction)
+                        for label, routing, correction in CONFIG_ENTRIES}
+
+    def __getitem__(self, key):
+        config, input_source = key
+        routing, correction = self.entries[config]
+        config_json = create_config(routing=routing,
+                                    input_source=input_source,
+                                    correction=correction,
+                                    playback_device=PLAYBACK_DEVICE,
+                                    playback_channels=PLAYBACK_CHANNELS,
+                                    crossover=CROSSOVER_FREQUENCY,
+                                    delay=MAINS_DELAY,
+                                    samplerate=SAMPLERATE,
+                                    drc_filter=DRC_FILTER)
+        digest = hashlib.sha256(config_json.encode()).hexdigest()
+        try:
+            return self.configs[digest]
+        except KeyError:
+            pass
+        validated = self.cdsp.validate_config(json.loads(config_json))
+        self.configs[digest] = validated
+        try:
+            save_config_cache(self.cache_path, self.configs)
+        except OSError as e:
+            print('Could not write config cache:', e)
+        return validated
+
+
+class DSPWorker(threading.Thread):
+    """Runs CamillaConnection calls off the GTK main loop.
+
+    Calls queued with submit() run in order on the worker thread.  Volume
+    writes go through a single "latest wins" slot instead, so a burst of
+    volume changes turns into one set_volume call.
+    """
+
+    def __init__(self, cdsp):
+        super().__init__(daemon=True)
+        self.cdsp = cdsp
+        self.calls = queue.SimpleQueue()
+        self.volume_lock = threading.Lock()
+        self.volume = None
+
+    def submit(self, func, *args, callback=None):
+        """Queue func(*args) to run on the worker thread.
+
+        If given, callback is called with the result from the GTK main
+        loop via GLib.idle_add, so it must not return a true value.
+        """
+        self.calls.put((func, args, callback))
+
+    def set_volume(self, vol):
+        with self.volume_lock:
+            queued = self.volume is not None
+            self.volume = vol
+        if not queued:
+            self.submit(self.write_volume)
+
+    def write_volume(self):
+        with self.volume_lock:
+            vol, self.volume = self.volume, None
+        self.cdsp.set_volume(vol)
+
+    def run(self):
+        while True:
+            func, args, callback = self.calls.get()
+            try:
+                result = func(*args)
+            except Exception as e:
+                # keep serving calls; volume and mute are resynced by
+                # polling, other callers must handle their own failures
+                print(f'DSP call {func.__name__} failed:', e)
+                continue
+            if callback is not None:
+                GLib.idle_add(callback, result)
 
 
 def get_screen_size():
     display = Gdk.Display.get_default()
-    n_monitors = display.get_n_monitors()
-    monitor_map = {}
-    for m in range(n_monitors):
-        monitor = display.get_monitor(m)
-        geometry = monitor.get_geometry()
-        return geometry.width, geometry.height
+    monitor = display.get_primary_monitor() or display.get_monitor(0)
+    geometry = monitor.get_geometry()
+    return geometry.width, geometry.height
 
     
 class MyWindow(Gtk.Window):
     def __init__(self):
         super().__init__()
         print('DEBUG:', DEBUG)
-        # CSS boilerplate
-        screen = Gdk.Screen.get_default()
-        provider = Gtk.CssProvider()
-        style_context = Gtk.StyleContext()
-        style_context.add_provider_for_screen(
-            screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        Gtk.StyleContext.add_provider_for_screen(
+            Gdk.Screen.get_default(), CSS_PROVIDER,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
-        provider.load_from_data(CSS)
         self.cdsp = CamillaConnection(HOST, PORT)
         self.cdsp.connect()
-        # create and validate all user selectable configurations
-        self.config_map = {}
-        self.create_configs()
+        # client-side copies of the DSP volume and mute state, so key
+        # presses only need to write through to the DSP; both are
+        # periodically re-read to pick up changes made elsewhere
+        self._vol = self.cdsp.get_volume()
+        self._muted = self.cdsp.get_mute()
+        # bumped on every local volume change/mute toggle, so that polls
+        # queued before it don't overwrite it with stale state
+        self._vol_serial = 0
+        self._mute_serial = 0
+        # from here on the connection is only used from the worker thread
+        self.dsp = DSPWorker(self.cdsp)
+        self.dsp.start()
+        # volume/balance key repeats are accumulated here and flushed to
+        # the DSP once per main loop iteration
+        self._pending_vol = 0.0
+        self._vol_flush_pending = False
+        self._pending_balance = 0
+        self._balance_flush_pending = False
+        # active DSP config, reused for balance changes until the next
+        # poll so changes by other clients aren't kept out for long;
+        # only touched from the worker thread
+        self._active_config = None
+        # GLib source id of the running mute blink timer, if any
+        self._blink_source_id = None
+        # whether the volume label is currently blanked by the blink timer
+        self._blink_on = False
+        # index of the current entry in each MENU_MAP menu
+        self._menu_index = {key: 0 for key in MENU_MAP}
+        # menu position of the config the DSP is actually running, and a
+        # counter identifying the most recent config load request
+        self._applied_menu_index = dict(self._menu_index)
+        self._config_serial = 0
+        # user selectable configurations, built and validated on first use
+        # from the worker thread
+        self.config_map = ConfigMap(self.cdsp)
         self.config_label = Gtk.Label(name='config')
         self.source_label = Gtk.Label(name='source')
         self.volume_label = Gtk.Label(name='volume')
@@ -280,7 +479,7 @@ class MyWindow(Gtk.Window):
         vbox.pack_start(hbox, True, True, 0) 
         vbox.pack_start(self.config_label, True, True, 0) 
         #self.volume_label.set_padding(100, 100)
-        self.set_volume()
+        self._update_volume_label()
         self.load_config_object(MENU_MAP['config'][0], MENU_MAP['source'][0])
         #self.set_config_name()
         #self.config_label.set_text('2.1 DRC')
@@ -291,136 +490,177 @@ class MyWindow(Gtk.Window):
         # and set window size "manually".
         width, height = get_screen_size()
         self.resize(width, height)
+        # resolve KEYBINDINGS to bound methods once, not on every keystroke
+        self._key_dispatch = {keyval: getattr(self, 'on_'+action)
+                              for keyval, action in KEYBINDINGS.items()
+                              if action}
+        self._repeatable_keys = {keyval
+                                 for keyval, action in KEYBINDINGS.items()
+                                 if action in REPEATABLE_ACTIONS}
+        # time of the last accepted event per repeatable key
+        self._last_key_time = {}
         self.connect("key-press-event", self.on_key_press_event)
         self.start_mute_timer()
-
-    def create_configs(self):
-        """Create user-selectable Camilla config objects and validate them."""
-        for config in MENU_MAP['config']:
-            for input_source in MENU_MAP['source']:
-                routing, *correction = config.split()
-                correction = correction[0] if correction else ''
-                camilla_config_obj = create_config(routing=routing,
-                                                   input_source=input_source,
-                                                   correction=correction,
-                                                   playback_device=PLAYBACK_DEVICE,
-                                                   playback_channels=PLAYBACK_CHANNELS,
-                                                   crossover=CROSSOVER_FREQUENCY,
-                                                   delay=MAINS_DELAY,
-                                                   samplerate=SAMPLERATE,
-                                                   drc_filter=DRC_FILTER
-                                    )
-                validated = self.cdsp.validate_config(camilla_config_obj)
-                self.config_map[(config, input_source)] = validated
+        GLib.timeout_add(VOL_POLL_INTERVAL, self.poll_dsp_state)
 
     def on_key_press_event(self, widget, event):
-        print('keyval:', Gdk.keyval_name(event.keyval))
-        action = KEYBINDINGS.get(event.keyval)
-        if action:
-            method = getattr(self, 'on_'+action)
+        if DEBUG:
+            print('keyval:', Gdk.keyval_name(event.keyval))
+        if event.keyval in self._repeatable_keys:
+            # event.time is a wrapping 32-bit ms counter, so a negative
+            # difference means it wrapped; synthetic events have no time
+            last = self._last_key_time.get(event.keyval)
+            if (event.time != Gdk.CURRENT_TIME and last is not None
+                    and 0 <= event.time - last < KEY_REPEAT_INTERVAL):
+                return
+            self._last_key_time[event.keyval] = event.time
+        method = self._key_dispatch.get(event.keyval)
+        if method:
             method()
 
     def on_mute(self):
         #print('Toggling mute...')
-        muted = self.cdsp.get_mute()
-        self.cdsp.set_mute(not muted)
-        if self.cdsp.get_mute():
+        self._muted = not self._muted
+        self._mute_serial += 1
+        self.dsp.submit(self.cdsp.set_mute, self._muted)
+        if self._muted:
             self.start_mute_timer()
 
     def on_vol_down(self):
         #print('Volume down...')
-        vol = self.cdsp.get_volume()
-        if vol > MIN_VOL:
-            self.cdsp.set_volume(vol - VOL_STEP)
-        self.set_volume()
+        self._pending_vol -= VOL_STEP
+        self._schedule_vol_flush()
 
     def on_vol_up(self):
         #print('Volume up...')
-        vol = self.cdsp.get_volume()
-        if vol <= -VOL_STEP:
-            self.cdsp.set_volume(vol + VOL_STEP)
-        self.set_volume()
+        self._pending_vol += VOL_STEP
+        self._schedule_vol_flush()
+
+    def _schedule_vol_flush(self):
+        if not self._vol_flush_pending:
+            self._vol_flush_pending = True
+            GLib.idle_add(self._flush_vol)
+
+    def _flush_vol(self):
+        """Apply all volume steps accumulated since the last flush."""
+        delta, self._pending_vol = self._pending_vol, 0.0
+        self._vol_flush_pending = False
+        new_vol = min(max(self._vol + delta, MIN_VOL), 0.0)
+        if new_vol != self._vol:
+            self._vol = new_vol
+            self._vol_serial += 1
+            self.dsp.set_volume(new_vol)
+            self._update_volume_label()
+        return False
         
     def on_source_next(self):
-        print('on_source_next')
+        if DEBUG:
+            print('on_source_next')
         self.menu_step('source', +1)
         
     def on_source_prev(self):
-        print('on_source_prev')
+        if DEBUG:
+            print('on_source_prev')
         self.menu_step('source', -1)
 
     def on_config_next(self):
-        print('on_config_next')
+        if DEBUG:
+            print('on_config_next')
         self.menu_step('config', +1)
         
     def on_config_prev(self):
-        print('on_config_prev')
+        if DEBUG:
+            print('on_config_prev')
         self.menu_step('config', -1)
         
     def on_track_play(self):
-        print('on_track_play')
+        if DEBUG:
+            print('on_track_play')
         
     def on_track_next(self):
-        print('on_track_next')
+        if DEBUG:
+            print('on_track_next')
 
     def on_track_prev(self):
-        print('on_track_prev')
+        if DEBUG:
+            print('on_track_prev')
 
     def on_track_stop(self):
-        print('on_track_stop')
+        if DEBUG:
+            print('on_track_stop')
         
     def on_menu(self):
-        print('on_menu')
+        if DEBUG:
+            print('on_menu')
         
     def on_nav_left(self):
-        self.set_balance(side='left')
+        self._pending_balance -= 1
+        self._schedule_balance_flush()
         
     def on_nav_right(self):
-        self.set_balance(side='right')
+        self._pending_balance += 1
+        self._schedule_balance_flush()
+
+    def _schedule_balance_flush(self):
+        if not self._balance_flush_pending:
+            self._balance_flush_pending = True
+            GLib.idle_add(self._flush_balance)
+
+    def _flush_balance(self):
+        """Apply all balance steps accumulated since the last flush."""
+        steps, self._pending_balance = self._pending_balance, 0
+        self._balance_flush_pending = False
+        if steps:
+            side = 'right' if steps > 0 else 'left'
+            self.dsp.submit(self.set_balance, side, abs(steps))
+        return False
 
     def on_nav_up(self):
-        print('on_nav_up')
+        if DEBUG:
+            print('on_nav_up')
 
     def on_nav_down(self):
-        print('on_nav_down')
+        if DEBUG:
+            print('on_nav_down')
         
     def on_nav_select(self):
-        print('on_nav_select')
+        if DEBUG:
+            print('on_nav_select')
         
     def on_nav_exit(self):
-        print('on_nav_exit')
+        if DEBUG:
+            print('on_nav_exit')
         
-    def start_mute_timer(self):
-        if self.cdsp.get_mute():
-            self.start_mute_timer()
-                
+    # get_balance/set_balance run on the worker thread
+
     def get_balance(self):
-        config_obj = self.cdsp.get_config()
+        if self._active_config is None:
+            self._active_config = self.cdsp.get_config()
+        config_obj = self._active_config
         gain0 = config_obj['filters']['balance0']['parameters']['gain']
         gain1 = config_obj['filters']['balance1']['parameters']['gain']
         return config_obj, gain0, gain1
         
-    def set_balance(self, side='left'):
+    def set_balance(self, side='left', steps=1):
         config_obj, gain0, gain1 = self.get_balance()
-        if side == 'left':
-            if gain0 == 0.0:
-                new_gain0 = 0.0
-                new_gain1 = gain1 - VOL_STEP
-            else:
-                new_gain0 = gain0 + VOL_STEP
-                new_gain1 = 0.0
-        elif side == 'right':
-            if gain1 == 0.0:
-                new_gain1 = 0.0
-                new_gain0 = gain0 - VOL_STEP
-            else:
-                new_gain1 = gain1 + VOL_STEP
-                new_gain0 = 0.0
+        new_gain0, new_gain1 = gain0, gain1
+        for _ in range(steps):
+            new_gain0, new_gain1 = step_balance(new_gain0, new_gain1, side)
         if side in ['left', 'right']:
-            print('set_balance:', new_gain0, new_gain1)
+            if DEBUG:
+                print('set_balance:', new_gain0, new_gain1)
             config_obj['filters']['balance0']['parameters']['gain'] = new_gain0
             config_obj['filters']['balance1']['parameters']['gain'] = new_gain1
-            self.cdsp.set_config(config_obj)
+            try:
+                self.cdsp.set_config(config_obj)
+            except Exception:
+                # the cached copy now has gains the DSP never got
+                self._active_config = None
+                raise
+
+    def forget_active_config(self):
+        # runs on the worker thread
+        self._active_config = None
 
     def set_config_name(self, config='', source=''):
         #path = self.cdsp.get_config_name()
@@ -432,48 +672,98 @@ class MyWindow(Gtk.Window):
     def load_config_by_desc(self, config='', source=''):
         basename = f"{source}-{config.replace(' ', '-')}.yml"
         path = os.path.join(CONFIG_DIR, basename)
-        self.cdsp.set_config_name(path)
-        self.cdsp.reload()
+        self.dsp.submit(self.cdsp.set_config_name, path)
+        self.dsp.submit(self.cdsp.reload)
         #self.set_config_name(config=config, source=source)
         self.config_label.set_text(config)
         self.source_label.set_text(source)
         
     def load_config_object(self, config='', source=''):
-        config_obj = self.config_map[(config, source)]
-        self.cdsp.set_config(config_obj)
-        self.config_label.set_text(config)
-        self.source_label.set_text(source)
+        # the labels are only updated once the DSP has taken the config
+        self._config_serial += 1
+        done = functools.partial(self._config_applied, self._config_serial,
+                                 config, source, dict(self._menu_index))
+        self.dsp.submit(self.apply_config_object, config, source,
+                        callback=done)
+
+    def apply_config_object(self, config, source):
+        # runs on the worker thread; returns whether the config was applied
+        try:
+            config_obj = self.config_map[(config, source)]
+            self.cdsp.set_config(config_obj)
+        except Exception as e:
+            print(f'Could not load config {config!r} for {source!r}:', e)
+            return False
+        # re-read from the DSP on the next balance change
+        self._active_config = None
+        return True
+
+    def _config_applied(self, serial, config, source, menu_index, applied):
+        if applied:
+            self._applied_menu_index = menu_index
+            self.config_label.set_text(config)
+            self.source_label.set_text(source)
+        elif serial == self._config_serial:
+            # no newer load is pending: step the menu back to the config
+            # the DSP is still running
+            self._menu_index = dict(self._applied_menu_index)
         
     def menu_step(self, key, step=1):
-        current_map = {key: getattr(self, f'{key}_label').get_text()
-                       for key in MENU_MAP}
-        menu_items = MENU_MAP[key]
-        current_index = menu_items.index(current_map[key])
-        next_index = (current_index + step) % len(menu_items)
-        next = menu_items[next_index]
-        current_map[key] = next
+        self._menu_index[key] = ((self._menu_index[key] + step)
+                                 % len(MENU_MAP[key]))
+        current_map = {key: MENU_MAP[key][index]
+                       for key, index in self._menu_index.items()}
         #self.load_config_by_desc(**current_map)
         self.load_config_object(**current_map)
         
-    def set_volume(self):
-        vol = self.cdsp.get_volume()
-        label = VOL_FORMAT.format(vol)
-        self.volume_label.set_text(label)
+    def _update_volume_label(self):
+        self.volume_label.set_text(format_volume(self._vol))
+
+    def poll_dsp_state(self):
+        self.dsp.submit(self.cdsp.get_volume,
+                        callback=functools.partial(self._set_vol,
+                                                   self._vol_serial))
+        self.dsp.submit(self.cdsp.get_mute,
+                        callback=functools.partial(self._set_muted,
+                                                   self._mute_serial))
+        self.dsp.submit(self.forget_active_config)
+        return True
+
+    def _set_vol(self, serial, vol):
+        if serial == self._vol_serial and vol != self._vol:
+            self._vol = vol
+            self._update_volume_label()
 
     def blink_vol(self):
-        if not self.cdsp.get_mute():
+        if not self._muted:
             self.volume_label.set_opacity(self.volume_label_opacity)
+            self._blink_source_id = None
+            self._blink_on = False
             return False
-        opacity = 0 if self.volume_label.get_opacity() else self.volume_label_opacity
-        self.volume_label.set_opacity(opacity)
+        self._blink_on = not self._blink_on
+        self.volume_label.set_opacity(
+            0 if self._blink_on else self.volume_label_opacity)
         return True
 
+    def _set_muted(self, serial, muted):
+        if serial == self._mute_serial and muted != self._muted:
+            self._muted = muted
+            # muted by another client; unmuting stops the blink by itself
+            if muted and self._blink_source_id is None:
+                self.start_mute_timer()
+
     def start_mute_timer(self):
-        self.volume_label_opacity = self.volume_label.get_opacity()
-        GLib.timeout_add(500, self.blink_vol)
+        if self._blink_source_id is not None:
+            # rapid mute toggling: don't stack blink timers
+            GLib.source_remove(self._blink_source_id)
+        else:
+            self.volume_label_opacity = self.volume_label.get_opacity()
+        self._blink_source_id = GLib.timeout_add(500, self.blink_vol)
 
         
 win = MyWindow()
 win.connect("destroy", Gtk.main_quit)
 win.show_all()
+# GTK's default, but make sure motion events stay coalesced
+win.get_window().set_event_compression(True)
 Gtk.main()